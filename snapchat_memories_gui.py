@@ -3,8 +3,8 @@ import re
 import sys
 from pathlib import Path
 
-from PyQt6.QtCore import QProcess
-from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import QProcess, QTimer
+from PyQt6.QtGui import QFontDatabase, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -26,28 +26,69 @@ from PyQt6.QtWidgets import (
 )
 
 
+_PROGRESS_RE = re.compile(rb"\[(\d+)/(\d+)\]")
+_NEEDS_QUOTE_RE = re.compile(r"""[\s"']""")
+
+
+def _help_label(text: str) -> QLabel:
+    label = QLabel(text)
+    label.setWordWrap(True)
+    label.setStyleSheet("color: #555;")
+    label.setContentsMargins(24, 0, 0, 6)
+    return label
+
+
 def _display_arg(value: str) -> str:
     if not value:
         return '""'
-    if any(ch.isspace() for ch in value) or any(ch in "\"'" for ch in value):
-        return f'"{value}"'
-    return value
+    return f'"{value}"' if _NEEDS_QUOTE_RE.search(value) else value
 
 
 class DownloaderGUI(QMainWindow):
+    # Download-mode flags in argv order, paired with the checkbox enabling each.
+    _FLAG_TABLE = tuple(
+        (sys.intern(flag), attr)
+        for flag, attr in (
+            ("--resume", "resume_checkbox"),
+            ("--retry-failed", "retry_failed_checkbox"),
+            ("--test", "test_checkbox"),
+            ("--merge-overlays", "merge_overlays_checkbox"),
+            ("--defer-video-overlays", "defer_video_overlays_checkbox"),
+            ("--videos-only", "videos_only_checkbox"),
+            ("--pictures-only", "pictures_only_checkbox"),
+            ("--overlays-only", "overlays_only_checkbox"),
+            ("--timestamp-filenames", "timestamp_filenames_checkbox"),
+            ("--remove-duplicates", "remove_duplicates_checkbox"),
+            ("--join-multi-snaps", "join_multi_snaps_checkbox"),
+        )
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self.root_dir = Path(__file__).resolve().parent
         self.script_path = self.root_dir / "download_memories.py"
+        self._script_path_str = str(self.script_path)
         self.process = None
 
-        self._progress_re = re.compile(r"\[(\d+)/(\d+)\]")
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self._do_update_command_preview)
+        self._last_preview_state = None
+        self._last_total = None
+        self._last_current = None
 
         self._build_ui()
         self._connect_signals()
         self._on_merge_overlays_toggled(self.merge_overlays_checkbox.isChecked())
         self._update_mode_ui()
-        self._update_command_preview()
+        self._do_update_command_preview()
 
     def _build_ui(self) -> None:
         self.setWindowTitle("Snapchat Memories Downloader (GUI)")
@@ -88,68 +129,13 @@ class DownloaderGUI(QMainWindow):
         mode_row.addWidget(self.mode_combo, 1)
         layout.addLayout(mode_row)
 
-        self.download_group = QGroupBox("Download inputs")
-        download_layout = QVBoxLayout(self.download_group)
-        download_grid = QHBoxLayout()
-        download_left = QVBoxLayout()
-        download_right = QVBoxLayout()
+        self._main_layout = layout
+        self._build_download_ui(layout)
 
-        self.html_path_edit = QLineEdit()
-        self.html_path_edit.setPlaceholderText(
-            "Path to memories_history.html or folder containing it"
-        )
-        self.html_browse_button = QPushButton("Browse HTML")
-        download_left.addWidget(QLabel("memories_history.html"))
-        download_left.addWidget(self.html_path_edit)
-        download_right.addWidget(self.html_browse_button)
-
-        self.output_path_edit = QLineEdit("memories")
-        self.output_browse_button = QPushButton("Browse Output Folder")
-
-        download_grid.addLayout(download_left, 1)
-        download_grid.addLayout(download_right)
-        download_layout.addLayout(download_grid)
-
-        def help_label(text: str) -> QLabel:
-            label = QLabel(text)
-            label.setWordWrap(True)
-            label.setStyleSheet("color: #555;")
-            label.setContentsMargins(24, 0, 0, 6)
-            return label
-
-        output_layout = QHBoxLayout()
-        output_left = QVBoxLayout()
-        output_left.addWidget(QLabel("Output folder"))
-        output_left.addWidget(self.output_path_edit)
-        output_layout.addLayout(output_left, 1)
-        output_layout.addWidget(self.output_browse_button)
-        download_layout.addLayout(output_layout)
-
-        download_note = QLabel(
-            "The output folder will contain your files plus metadata.json for resume/retry."
-        )
-        download_note.setWordWrap(True)
-        download_layout.addWidget(download_note)
-        layout.addWidget(self.download_group)
-
-        self.merge_group = QGroupBox("Merge existing overlay pairs")
-        merge_layout = QVBoxLayout(self.merge_group)
-        merge_row = QHBoxLayout()
-        self.merge_folder_edit = QLineEdit()
-        self.merge_folder_edit.setPlaceholderText(
-            "Folder with -main and -overlay files"
-        )
-        self.merge_browse_button = QPushButton("Browse Folder")
-        merge_row.addWidget(self.merge_folder_edit, 1)
-        merge_row.addWidget(self.merge_browse_button)
-        merge_layout.addWidget(QLabel("Folder"))
-        merge_layout.addLayout(merge_row)
-        merge_note = QLabel(
-            "This creates merged files next to the originals and does not delete -main/-overlay files."
-        )
-        merge_note.setWordWrap(True)
-        merge_layout.addWidget(merge_note)
-        layout.addWidget(self.merge_group)
+        # The merge group is built on first switch to merge mode.
+        self.merge_group = None
+        self.merge_folder_edit = None
+        self.merge_browse_button = None
 
         self.run_mode_group = QGroupBox("Run mode")
         run_layout = QVBoxLayout(self.run_mode_group)
@@ -158,15 +144,15 @@ class DownloaderGUI(QMainWindow):
         self.test_checkbox = QCheckBox("Test mode (first 3 items only)")
         run_layout.addWidget(self.resume_checkbox)
         run_layout.addWidget(
-            help_label("Uses metadata.json to continue pending or failed items.")
+            _help_label("Uses metadata.json to continue pending or failed items.")
         )
         run_layout.addWidget(self.retry_failed_checkbox)
         run_layout.addWidget(
-            help_label("Only re-download items marked as failed in metadata.json.")
+            _help_label("Only re-download items marked as failed in metadata.json.")
         )
         run_layout.addWidget(self.test_checkbox)
         run_layout.addWidget(
-            help_label("Quick check for dependencies. Ignores filters like videos-only.")
+            _help_label("Quick check for dependencies. Ignores filters like videos-only.")
         )
 
         threads_row = QHBoxLayout()
@@ -179,7 +165,7 @@ class DownloaderGUI(QMainWindow):
         threads_row.addStretch(1)
         run_layout.addLayout(threads_row)
         run_layout.addWidget(
-            help_label("Higher values use more bandwidth/CPU. Set to 1 for sequential.")
+            _help_label("Higher values use more bandwidth/CPU. Set to 1 for sequential.")
         )
         layout.addWidget(self.run_mode_group)
 
@@ -189,12 +175,12 @@ class DownloaderGUI(QMainWindow):
         self.pictures_only_checkbox = QCheckBox("Pictures only")
         self.overlays_only_checkbox = QCheckBox("Overlays only")
         filter_layout.addWidget(self.videos_only_checkbox)
-        filter_layout.addWidget(help_label("Download and process only video memories."))
+        filter_layout.addWidget(_help_label("Download and process only video memories."))
         filter_layout.addWidget(self.pictures_only_checkbox)
-        filter_layout.addWidget(help_label("Download and process only image memories."))
+        filter_layout.addWidget(_help_label("Download and process only image memories."))
         filter_layout.addWidget(self.overlays_only_checkbox)
         filter_layout.addWidget(
-            help_label("Skip memories without overlays (only ZIP overlay items).")
+            _help_label("Skip memories without overlays (only ZIP overlay items).")
         )
         layout.addWidget(self.filter_group)
 
@@ -206,11 +192,11 @@ class DownloaderGUI(QMainWindow):
         )
         overlay_layout.addWidget(self.merge_overlays_checkbox)
         overlay_layout.addWidget(
-            help_label("Combine -main and -overlay into one file. Videos require FFmpeg.")
+            _help_label("Combine -main and -overlay into one file. Videos require FFmpeg.")
         )
         overlay_layout.addWidget(self.defer_video_overlays_checkbox)
         overlay_layout.addWidget(
-            help_label("Download everything first, then merge videos. Requires merge overlays.")
+            _help_label("Download everything first, then merge videos. Requires merge overlays.")
         )
         layout.addWidget(self.overlay_group)
 
@@ -219,7 +205,7 @@ class DownloaderGUI(QMainWindow):
         self.timestamp_filenames_checkbox = QCheckBox("Timestamp-based filenames")
         naming_layout.addWidget(self.timestamp_filenames_checkbox)
         naming_layout.addWidget(
-            help_label("Use YYYY.MM.DD-HH-MM-SS.ext instead of sequential numbers (Windows-safe).")
+            _help_label("Use YYYY.MM.DD-HH-MM-SS.ext instead of sequential numbers (Windows-safe).")
         )
         layout.addWidget(self.naming_group)
 
@@ -229,11 +215,11 @@ class DownloaderGUI(QMainWindow):
         self.join_multi_snaps_checkbox = QCheckBox("Join multi-snap videos")
         extra_layout.addWidget(self.remove_duplicates_checkbox)
         extra_layout.addWidget(
-            help_label("Skips duplicates using size and MD5 hash checks.")
+            _help_label("Skips duplicates using size and MD5 hash checks.")
         )
         extra_layout.addWidget(self.join_multi_snaps_checkbox)
         extra_layout.addWidget(
-            help_label("Joins videos captured within 10 seconds (requires FFmpeg).")
+            _help_label("Joins videos captured within 10 seconds (requires FFmpeg).")
         )
         layout.addWidget(self.extra_group)
 
@@ -248,6 +234,9 @@ class DownloaderGUI(QMainWindow):
         layout.addWidget(command_label)
         self.command_preview = QPlainTextEdit()
         self.command_preview.setReadOnly(True)
+        self.command_preview.setUndoRedoEnabled(False)
+        self.command_preview.setCenterOnScroll(False)
+        self.command_preview.document().setMaximumBlockCount(1)
         self.command_preview.setMaximumHeight(70)
         layout.addWidget(self.command_preview)
 
@@ -275,24 +264,90 @@ class DownloaderGUI(QMainWindow):
         layout.addWidget(log_label)
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
-        self.log_output.setMaximumBlockCount(2000)
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.setCenterOnScroll(False)
+        self.log_output.setFont(
+            QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        )
+        self.log_output.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.log_output.document().setMaximumBlockCount(2000)
         layout.addWidget(self.log_output)
 
+    def _build_download_ui(self, layout: QVBoxLayout) -> None:
+        self.download_group = QGroupBox("Download inputs")
+        download_layout = QVBoxLayout(self.download_group)
+        download_grid = QHBoxLayout()
+        download_left = QVBoxLayout()
+        download_right = QVBoxLayout()
+
+        self.html_path_edit = QLineEdit()
+        self.html_path_edit.setPlaceholderText(
+            "Path to memories_history.html or folder containing it"
+        )
+        self.html_browse_button = QPushButton("Browse HTML")
+        download_left.addWidget(QLabel("memories_history.html"))
+        download_left.addWidget(self.html_path_edit)
+        download_right.addWidget(self.html_browse_button)
+
+        self.output_path_edit = QLineEdit("memories")
+        self.output_browse_button = QPushButton("Browse Output Folder")
+
+        download_grid.addLayout(download_left, 1)
+        download_grid.addLayout(download_right)
+        download_layout.addLayout(download_grid)
+
+        output_layout = QHBoxLayout()
+        output_left = QVBoxLayout()
+        output_left.addWidget(QLabel("Output folder"))
+        output_left.addWidget(self.output_path_edit)
+        output_layout.addLayout(output_left, 1)
+        output_layout.addWidget(self.output_browse_button)
+        download_layout.addLayout(output_layout)
+
+        download_note = QLabel(
+            "The output folder will contain your files plus metadata.json for resume/retry."
+        )
+        download_note.setWordWrap(True)
+        download_layout.addWidget(download_note)
+        layout.addWidget(self.download_group)
+
+    def _build_merge_ui(self) -> None:
+        self.merge_group = QGroupBox("Merge existing overlay pairs")
+        merge_layout = QVBoxLayout(self.merge_group)
+        merge_row = QHBoxLayout()
+        self.merge_folder_edit = QLineEdit()
+        self.merge_folder_edit.setPlaceholderText(
+            "Folder with -main and -overlay files"
+        )
+        self.merge_browse_button = QPushButton("Browse Folder")
+        merge_row.addWidget(self.merge_folder_edit, 1)
+        merge_row.addWidget(self.merge_browse_button)
+        merge_layout.addWidget(QLabel("Folder"))
+        merge_layout.addLayout(merge_row)
+        merge_note = QLabel(
+            "This creates merged files next to the originals and does not delete -main/-overlay files."
+        )
+        merge_note.setWordWrap(True)
+        merge_layout.addWidget(merge_note)
+
+        layout = self._main_layout
+        layout.insertWidget(layout.indexOf(self.download_group) + 1, self.merge_group)
+
+        self.merge_browse_button.clicked.connect(self._choose_merge_folder)
+        self.merge_folder_edit.textChanged.connect(self._update_command_preview)
+
     def _connect_signals(self) -> None:
-        self.mode_combo.currentIndexChanged.connect(self._update_mode_ui)
-        self.mode_combo.currentIndexChanged.connect(self._update_command_preview)
+        self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         self.html_browse_button.clicked.connect(self._choose_html_file)
         self.output_browse_button.clicked.connect(self._choose_output_folder)
-        self.merge_browse_button.clicked.connect(self._choose_merge_folder)
         self.start_button.clicked.connect(self._start_process)
         self.stop_button.clicked.connect(self._stop_process)
-        self.clear_button.clicked.connect(self.log_output.clear)
+        self.clear_button.clicked.connect(self._clear_log)
 
         self.html_path_edit.textChanged.connect(self._update_command_preview)
         self.output_path_edit.textChanged.connect(self._update_command_preview)
-        self.merge_folder_edit.textChanged.connect(self._update_command_preview)
 
-        for checkbox in [
+        self._all_checkboxes = (
             self.resume_checkbox,
             self.retry_failed_checkbox,
             self.test_checkbox,
@@ -304,17 +359,26 @@ class DownloaderGUI(QMainWindow):
             self.timestamp_filenames_checkbox,
             self.remove_duplicates_checkbox,
             self.join_multi_snaps_checkbox,
-        ]:
-            checkbox.toggled.connect(self._update_command_preview)
+        )
+        # Checkboxes with their own toggled slot refresh the preview there.
+        exclusive_handlers = {
+            self.resume_checkbox: self._on_resume_toggled,
+            self.retry_failed_checkbox: self._on_retry_toggled,
+            self.test_checkbox: self._on_test_toggled,
+            self.videos_only_checkbox: self._on_videos_only_toggled,
+            self.pictures_only_checkbox: self._on_pictures_only_toggled,
+            self.merge_overlays_checkbox: self._on_merge_overlays_toggled,
+        }
+        for checkbox in self._all_checkboxes:
+            checkbox.toggled.connect(
+                exclusive_handlers.get(checkbox, self._update_command_preview)
+            )
 
         self.threads_spin.valueChanged.connect(self._update_command_preview)
 
-        self.resume_checkbox.toggled.connect(self._on_resume_toggled)
-        self.retry_failed_checkbox.toggled.connect(self._on_retry_toggled)
-        self.test_checkbox.toggled.connect(self._on_test_toggled)
-        self.videos_only_checkbox.toggled.connect(self._on_videos_only_toggled)
-        self.pictures_only_checkbox.toggled.connect(self._on_pictures_only_toggled)
-        self.merge_overlays_checkbox.toggled.connect(self._on_merge_overlays_toggled)
+    def _on_mode_changed(self, _index: int) -> None:
+        self._update_mode_ui()
+        self._update_command_preview()
 
     def _update_mode_ui(self) -> None:
         download_mode = self.mode_combo.currentIndex() == 0
@@ -324,6 +388,10 @@ class DownloaderGUI(QMainWindow):
         self.overlay_group.setVisible(download_mode)
         self.naming_group.setVisible(download_mode)
         self.extra_group.setVisible(download_mode)
+        if self.merge_group is None:
+            if download_mode:
+                return
+            self._build_merge_ui()
         self.merge_group.setVisible(not download_mode)
 
     def _choose_html_file(self) -> None:
@@ -354,92 +422,116 @@ class DownloaderGUI(QMainWindow):
         if checked:
             self.retry_failed_checkbox.setChecked(False)
             self.test_checkbox.setChecked(False)
+        self._update_command_preview()
 
     def _on_retry_toggled(self, checked: bool) -> None:
         if checked:
             self.resume_checkbox.setChecked(False)
             self.test_checkbox.setChecked(False)
+        self._update_command_preview()
 
     def _on_test_toggled(self, checked: bool) -> None:
         if checked:
             self.resume_checkbox.setChecked(False)
             self.retry_failed_checkbox.setChecked(False)
+        self._update_command_preview()
 
     def _on_videos_only_toggled(self, checked: bool) -> None:
         if checked:
             self.pictures_only_checkbox.setChecked(False)
+        self._update_command_preview()
 
     def _on_pictures_only_toggled(self, checked: bool) -> None:
         if checked:
             self.videos_only_checkbox.setChecked(False)
+        self._update_command_preview()
 
     def _on_merge_overlays_toggled(self, checked: bool) -> None:
         self.defer_video_overlays_checkbox.setEnabled(checked)
         if not checked:
             self.defer_video_overlays_checkbox.setChecked(False)
+        self._update_command_preview()
 
     def _build_args(self) -> list:
-        args = []
         if self.mode_combo.currentIndex() == 1:
             merge_folder = self.merge_folder_edit.text().strip()
-            if merge_folder:
-                args.extend(["--merge-existing", merge_folder])
-            return args
+            return ["--merge-existing", merge_folder] if merge_folder else []
 
         html_path = self.html_path_edit.text().strip()
-        if html_path:
-            args.append(html_path)
-
+        args = [html_path] if html_path else []
         output_dir = self.output_path_edit.text().strip()
         if output_dir:
-            args.extend(["-o", output_dir])
-
-        if self.resume_checkbox.isChecked():
-            args.append("--resume")
-        if self.retry_failed_checkbox.isChecked():
-            args.append("--retry-failed")
-        if self.test_checkbox.isChecked():
-            args.append("--test")
-        if self.merge_overlays_checkbox.isChecked():
-            args.append("--merge-overlays")
-        if self.defer_video_overlays_checkbox.isChecked():
-            args.append("--defer-video-overlays")
-        if self.videos_only_checkbox.isChecked():
-            args.append("--videos-only")
-        if self.pictures_only_checkbox.isChecked():
-            args.append("--pictures-only")
-        if self.overlays_only_checkbox.isChecked():
-            args.append("--overlays-only")
-        if self.timestamp_filenames_checkbox.isChecked():
-            args.append("--timestamp-filenames")
-        if self.remove_duplicates_checkbox.isChecked():
-            args.append("--remove-duplicates")
-        if self.join_multi_snaps_checkbox.isChecked():
-            args.append("--join-multi-snaps")
-        if self.threads_spin.value() > 1:
-            args.extend(["--threads", str(self.threads_spin.value())])
+            args += ["-o", output_dir]
+        args += [
+            flag for flag, attr in self._FLAG_TABLE if getattr(self, attr).isChecked()
+        ]
+        threads = self.threads_spin.value()
+        if threads > 1:
+            args += ["--threads", str(threads)]
 
         return args
 
     def _update_command_preview(self) -> None:
+        # Debounce keystrokes and toggles into a single rebuild.
+        self._preview_timer.start()
+
+    def _do_update_command_preview(self) -> None:
+        state = (
+            self.mode_combo.currentIndex(),
+            self.html_path_edit.text(),
+            self.output_path_edit.text(),
+            self.merge_folder_edit.text() if self.merge_folder_edit else "",
+            self.threads_spin.value(),
+            tuple(cb.isChecked() for cb in self._all_checkboxes),
+        )
+        if state == self._last_preview_state:
+            return
+        self._last_preview_state = state
+
         args = self._build_args()
-        command = [sys.executable, "-u", str(self.script_path)] + args
+        command = [sys.executable, "-u", self._script_path_str] + args
         preview = " ".join(_display_arg(arg) for arg in command)
         self.command_preview.setPlainText(preview)
 
     def _append_log(self, text: str) -> None:
-        cursor = self.log_output.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(text)
-        self.log_output.setTextCursor(cursor)
-
-    def _maybe_update_progress(self, line: str) -> None:
-        match = self._progress_re.search(line)
-        if not match:
+        self._queue_log(text.encode("utf-8"))
+
+    def _queue_log(self, data: bytes) -> None:
+        # Coalesce bursts of output into a single insert per timer tick.
+        self._log_buffer.append(data)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        text = b"".join(self._log_buffer).decode("utf-8", errors="replace")
+        self._log_buffer.clear()
+        self.log_output.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_output.insertPlainText(text)
+
+    def _clear_log(self) -> None:
+        self._log_timer.stop()
+        self._log_buffer.clear()
+        self.log_output.clear()
+
+    def _maybe_update_progress(self, lines: list) -> None:
+        # Only the most recent [i/n] marker in a read matters for the bar.
+        match = None
+        for line in lines:
+            match = _PROGRESS_RE.search(line) or match
+        if match is None:
             return
         current, total = int(match.group(1)), int(match.group(2))
-        self.progress_bar.setRange(0, total)
-        self.progress_bar.setValue(current)
+        # Skip redundant updates; each one schedules a repaint.
+        if (current, total) == (self._last_current, self._last_total):
+            return
+        if total != self._last_total:
+            self.progress_bar.setRange(0, total)
+            self._last_total = total
+        if current != self._last_current:
+            self.progress_bar.setValue(current)
+            self._last_current = current
         self.status_label.setText(f"Processing {current} of {total}")
 
     def _start_process(self) -> None:
@@ -465,12 +557,12 @@ class DownloaderGUI(QMainWindow):
                 )
                 return
 
-            output_dir = self.output_path_edit.text().strip() or "memories"
-            metadata_path = Path(output_dir) / "metadata.json"
-            if (self.resume_checkbox.isChecked() or self.retry_failed_checkbox.isChecked()) and not metadata_path.exists():
-                self._append_log(
-                    "Warning: metadata.json not found in output folder; resume/retry may fail.\n"
-                )
+            if self.resume_checkbox.isChecked() or self.retry_failed_checkbox.isChecked():
+                output_dir = self.output_path_edit.text().strip() or "memories"
+                if not Path(output_dir, "metadata.json").exists():
+                    self._append_log(
+                        "Warning: metadata.json not found in output folder; resume/retry may fail.\n"
+                    )
         else:
             merge_folder = self.merge_folder_edit.text().strip()
             if not merge_folder:
@@ -488,7 +580,7 @@ class DownloaderGUI(QMainWindow):
             QMessageBox.warning(self, "Already running", "A process is already running.")
             return
 
-        args = ["-u", str(self.script_path)] + self._build_args()
+        args = ["-u", self._script_path_str] + self._build_args()
 
         self.process = QProcess(self)
         self.process.setWorkingDirectory(str(self.root_dir))
@@ -497,6 +589,8 @@ class DownloaderGUI(QMainWindow):
         self.process.finished.connect(self._handle_process_finished)
 
         self.progress_bar.setRange(0, 0)
+        self._last_total = None
+        self._last_current = None
         self.status_label.setText("Running...")
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -517,20 +611,25 @@ class DownloaderGUI(QMainWindow):
     def _handle_process_output(self) -> None:
         if not self.process:
             return
-        data = bytes(self.process.readAllStandardOutput()).decode(
-            "utf-8", errors="replace"
-        )
-        if not data:
+        lines = []
+        while self.process.canReadLine():
+            lines.append(bytes(self.process.readLine()))
+        tail = bytes(self.process.readAllStandardOutput())
+        if tail:
+            lines.append(tail)
+        if not lines:
             return
-        self._append_log(data)
-        for line in data.splitlines():
-            self._maybe_update_progress(line)
+        for line in lines:
+            self._queue_log(line)
+        self._maybe_update_progress(lines)
 
     def _handle_process_finished(self, exit_code: int, _status: QProcess.ExitStatus) -> None:
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.progress_bar.setRange(0, 1)
         self.progress_bar.setValue(1)
+        self._last_total = None
+        self._last_current = None
         self.status_label.setText(f"Finished (exit code {exit_code})")
         self._append_log(f"Process finished with exit code {exit_code}.\n")
 